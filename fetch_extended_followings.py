@@ -15,14 +15,15 @@ Uses endpoints:
 Rate limited to comply with API limits.
 """
 
+import functools
 import http.client
-import json
 import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
 import toml
 from dotenv import load_dotenv
 
@@ -36,20 +37,23 @@ class RateLimiter:
     def __init__(self, requests_per_second=10):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.next_request_time = 0.0  # Earliest time the next request may start
         self.lock = threading.Lock()
 
     def wait_for_token(self):
-        """Wait until enough time has passed since last request"""
-        with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
+        """Wait until enough time has passed since last request
 
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                time.sleep(wait_time)
+        Each caller reserves the next free slot under the lock and then sleeps
+        outside it, so waiting threads don't serialize on the lock.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_request_time)
+            self.next_request_time = slot + self.min_interval
 
-            self.last_request_time = time.time()
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 # Initialize global rate limiter and request counter
@@ -57,6 +61,58 @@ rate_limiter = None
 request_count = 0
 start_time = None
 
+# Keep-alive connection per worker thread (http.client connections aren't
+# thread-safe), so the TCP/TLS handshake is paid once per thread, not per request
+_thread_local = threading.local()
+
+
+def get_connection():
+    """Get this thread's persistent HTTPS connection to the API host"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
+        _thread_local.conn = conn
+    return conn
+
+
+def reset_connection():
+    """Close this thread's connection so the next request opens a fresh one"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+
+# Errors from reusing a kept-alive socket the server has already closed
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def send_get(full_endpoint, headers):
+    """Send a GET on this thread's connection and read the response body
+
+    http.client does not reconnect on its own, so a keep-alive socket that went
+    stale while idle fails on first use. That failure is retried once, right
+    away, on a fresh connection instead of costing a backoff retry.
+
+    Returns:
+        Tuple of (response, body bytes)
+    """
+    try:
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+    except STALE_CONNECTION_ERRORS:
+        reset_connection()
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+
 
 def load_config():
     """Load configuration from config.toml"""
@@ -92,6 +148,15 @@ def get_api_key():
     return api_key
 
 
+@functools.lru_cache(maxsize=1)
+def get_api_headers():
+    """Get request headers, reading and cleaning the API key only once"""
+    return {
+        "x-rapidapi-key": get_api_key(),
+        "x-rapidapi-host": "twitter241.p.rapidapi.com",
+    }
+
+
 def make_request(endpoint, params="", max_retries=3):
     """Make HTTP request to RapidAPI with rate limiting and exponential backoff"""
     global request_count, start_time
@@ -99,6 +164,9 @@ def make_request(endpoint, params="", max_retries=3):
     if start_time is None:
         start_time = time.time()
 
+    # Headers are identical across attempts
+    headers = get_api_headers()
+
     for attempt in range(max_retries):
         if rate_limiter:
             rate_limiter.wait_for_token()
@@ -113,23 +181,12 @@ def make_request(endpoint, params="", max_retries=3):
             )
 
         try:
-            conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
-
-            headers = {
-                "x-rapidapi-key": get_api_key(),
-                "x-rapidapi-host": "twitter241.p.rapidapi.com",
-            }
-
             full_endpoint = f"{endpoint}?{params}" if params else endpoint
 
-            conn.request("GET", full_endpoint, headers=headers)
-
-            res = conn.getresponse()
-            data = res.read()
-            conn.close()
+            res, data = send_get(full_endpoint, headers)
 
             if res.status == 200:
-                return json.loads(data.decode("utf-8"))
+                return orjson.loads(data)
             elif res.status == 429:
                 if attempt < max_retries - 1:
                     backoff_time = 2**attempt
@@ -158,6 +215,8 @@ def make_request(endpoint, params="", max_retries=3):
                 return None
 
         except Exception as e:
+            # The connection may be stale or half-used; reconnect on retry
+            reset_connection()
             if attempt < max_retries - 1:
                 backoff_time = 2**attempt
                 print(
@@ -180,7 +239,7 @@ def get_user_following_ids(username, max_following=10000):
         max_following: Maximum number of following IDs to fetch
 
     Returns:
-        Set of following user IDs
+        Set of following user IDs (as ints)
     """
     following_ids_set = set()
     cursor = None
@@ -205,8 +264,8 @@ def get_user_following_ids(username, max_following=10000):
             if not new_ids:
                 break
 
-            # Convert all IDs to strings for consistency
-            following_ids_set.update(str(uid) for uid in new_ids)
+            # Keep IDs as ints: cheaper to hash and compare than strings
+            following_ids_set.update(map(int, new_ids))
 
             next_cursor = response.get("next_cursor")
             if next_cursor and next_cursor != cursor and next_cursor != 0:
@@ -232,7 +291,7 @@ def load_followings_file(raw_data_dir, seed_graph_name):
         seed_graph_name: Name of the seed graph
 
     Returns:
-        Tuple of (data dict, master_list_ids set)
+        Tuple of (data dict, master_list_ids set of ints)
     """
     filename = os.path.join(raw_data_dir, f"{seed_graph_name}_followings.json")
 
@@ -243,12 +302,14 @@ def load_followings_file(raw_data_dir, seed_graph_name):
 
     print(f"Loading {filename}...")
 
-    with open(filename, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(filename, "rb") as f:
+        data = orjson.loads(f.read())
 
     master_list = data.get("master_list", [])
     master_list_ids = set(
-        str(user.get("user_id")) for user in master_list if user.get("user_id")
+        int(user["user_id"])
+        for user in master_list
+        if str(user.get("user_id", "")).isdigit()
     )
 
     print(f"  Loaded {len(master_list_ids)} users in master list")
@@ -269,8 +330,8 @@ def load_progress(raw_data_dir, seed_graph_name):
 
     try:
         print(f"Loading existing progress from {filename}...")
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filename, "rb") as f:
+            data = orjson.loads(f.read())
 
         users = data.get("users", [])
         processed_ids = set(
@@ -285,13 +346,42 @@ def load_progress(raw_data_dir, seed_graph_name):
         return set(), None
 
 
+def write_json_streaming(f, data, stream_key):
+    """Write data as indented JSON, serializing data[stream_key] item by item
+
+    The document is never held as one bytes object in memory. Output is
+    identical to orjson.dumps(data, option=orjson.OPT_INDENT_2).
+    """
+    if not data:
+        f.write(b"{}")
+        return
+
+    f.write(b"{")
+    for i, (key, value) in enumerate(data.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(orjson.dumps(key))
+        f.write(b": ")
+        if key == stream_key and value:
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                # JSON strings escape newlines, so every raw newline is layout
+                item_json = orjson.dumps(item, option=orjson.OPT_INDENT_2)
+                f.write(item_json.replace(b"\n", b"\n    "))
+            f.write(b"\n  ]")
+        else:
+            value_json = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+            f.write(value_json.replace(b"\n", b"\n  "))
+    f.write(b"\n}")
+
+
 def save_extended_followings(output_data, raw_data_dir, seed_graph_name):
     """Save extended followings to JSON file"""
     filename = os.path.join(raw_data_dir, f"{seed_graph_name}_extended_followings.json")
     os.makedirs(raw_data_dir, exist_ok=True)
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with open(filename, "wb") as f:
+        write_json_streaming(f, output_data, "users")
 
     print(f"✓ Saved extended followings to: {filename}")
 
@@ -301,7 +391,7 @@ def fetch_single_user_followings(user, master_list_ids, index, total_users):
 
     Args:
         user: User dict with user_id, username, display_name
-        master_list_ids: Set of user IDs in master list
+        master_list_ids: Set of user IDs (as ints) in master list
         index: Current index for logging
         total_users: Total number of users for logging
 
@@ -326,7 +416,8 @@ def fetch_single_user_followings(user, master_list_ids, index, total_users):
         filtered_following_ids = following_ids.intersection(master_list_ids)
 
         # Remove self-follows
-        filtered_following_ids.discard(user_id)
+        if user_id.isdigit():
+            filtered_following_ids.discard(int(user_id))
 
         user_data = {
             "user_id": user_id,
@@ -334,7 +425,7 @@ def fetch_single_user_followings(user, master_list_ids, index, total_users):
             "display_name": user.get("display_name", username),
             "total_followings": len(following_ids),
             "filtered_followings_count": len(filtered_following_ids),
-            "following_ids": list(filtered_following_ids),
+            "following_ids": [str(uid) for uid in filtered_following_ids],
         }
 
         print(
@@ -355,7 +446,7 @@ def fetch_extended_followings(
 
     Args:
         master_list: List of user dicts from followings file
-        master_list_ids: Set of user IDs in master list
+        master_list_ids: Set of user IDs (as ints) in master list
         processed_ids: Set of already processed user IDs
         max_parallel: Maximum number of parallel requests
         save_interval: How often to save progress
@@ -429,6 +520,9 @@ def main():
         if not config:
             return
 
+        # Fail fast on a missing API key before any work is done
+        get_api_headers()
+
         # Get seed graph name from config
         seed_graph_config = config.get("seed_graph", {})
         if not seed_graph_config:
@@ -496,6 +590,9 @@ def main():
 
         save_interval = 1000  # Save every 1000 users
 
+        # Running total from the generator; starts from the saved file's total
+        total_filtered = output_data.get("total_filtered_followings")
+
         # Fetch extended followings
         for batch_users, total_filtered in fetch_extended_followings(
             master_list, master_list_ids, processed_ids, max_parallel, save_interval
@@ -515,9 +612,10 @@ def main():
             total_time = time.time() - start_time
             avg_rate = request_count / total_time if total_time > 0 else 0
             final_users = output_data.get("users", [])
-            total_filtered = sum(
-                u.get("filtered_followings_count", 0) for u in final_users
-            )
+            if total_filtered is None:
+                total_filtered = sum(
+                    u.get("filtered_followings_count", 0) for u in final_users
+                )
 
             print(f"\n{'=' * 60}")
             print(f"EXTENDED FOLLOWINGS FETCH COMPLETE")
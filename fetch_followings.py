@@ -18,14 +18,15 @@ Uses endpoints:
 Rate limited to 10 requests per second to comply with API limits.
 """
 
+import functools
 import http.client
-import json
 import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
 import toml
 from dotenv import load_dotenv
 
@@ -39,20 +40,23 @@ class RateLimiter:
     def __init__(self, requests_per_second=10):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second  # Minimum time between requests
-        self.last_request_time = 0
+        self.next_request_time = 0.0  # Earliest time the next request may start
         self.lock = threading.Lock()
 
     def wait_for_token(self):
-        """Wait until enough time has passed since last request"""
-        with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
+        """Wait until enough time has passed since last request
 
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                time.sleep(wait_time)
+        Each caller reserves the next free slot under the lock and then sleeps
+        outside it, so waiting threads don't serialize on the lock.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_request_time)
+            self.next_request_time = slot + self.min_interval
 
-            self.last_request_time = time.time()
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 # Initialize global rate limiter and request counter
@@ -60,6 +64,58 @@ rate_limiter = None
 request_count = 0
 start_time = None
 
+# Keep-alive connection per worker thread (http.client connections aren't
+# thread-safe), so the TCP/TLS handshake is paid once per thread, not per request
+_thread_local = threading.local()
+
+
+def get_connection():
+    """Get this thread's persistent HTTPS connection to the API host"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
+        _thread_local.conn = conn
+    return conn
+
+
+def reset_connection():
+    """Close this thread's connection so the next request opens a fresh one"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+
+# Errors from reusing a kept-alive socket the server has already closed
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def send_get(full_endpoint, headers):
+    """Send a GET on this thread's connection and read the response body
+
+    http.client does not reconnect on its own, so a keep-alive socket that went
+    stale while idle fails on first use. That failure is retried once, right
+    away, on a fresh connection instead of costing a backoff retry.
+
+    Returns:
+        Tuple of (response, body bytes)
+    """
+    try:
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+    except STALE_CONNECTION_ERRORS:
+        reset_connection()
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+
 
 def load_config():
     """Load configuration from config.toml"""
@@ -97,6 +153,15 @@ def get_api_key():
     return api_key
 
 
+@functools.lru_cache(maxsize=1)
+def get_api_headers():
+    """Get request headers, reading and cleaning the API key only once"""
+    return {
+        "x-rapidapi-key": get_api_key(),
+        "x-rapidapi-host": "twitter241.p.rapidapi.com",
+    }
+
+
 def make_request(endpoint, params="", max_retries=3):
     """Make HTTP request to RapidAPI with rate limiting and exponential backoff"""
     global request_count, start_time
@@ -105,6 +170,9 @@ def make_request(endpoint, params="", max_retries=3):
     if start_time is None:
         start_time = time.time()
 
+    # Headers are identical across attempts
+    headers = get_api_headers()
+
     for attempt in range(max_retries):
         # Wait for rate limiter before making request
         if rate_limiter:
@@ -122,23 +190,12 @@ def make_request(endpoint, params="", max_retries=3):
             )
 
         try:
-            conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
-
-            headers = {
-                "x-rapidapi-key": get_api_key(),
-                "x-rapidapi-host": "twitter241.p.rapidapi.com",
-            }
-
             full_endpoint = f"{endpoint}?{params}" if params else endpoint
 
-            conn.request("GET", full_endpoint, headers=headers)
-
-            res = conn.getresponse()
-            data = res.read()
-            conn.close()
+            res, data = send_get(full_endpoint, headers)
 
             if res.status == 200:
-                return json.loads(data.decode("utf-8"))
+                return orjson.loads(data)
             elif res.status == 429:  # Rate limit exceeded
                 if attempt < max_retries - 1:
                     backoff_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
@@ -167,6 +224,8 @@ def make_request(endpoint, params="", max_retries=3):
                 return None
 
         except Exception as e:
+            # The connection may be stale or half-used; reconnect on retry
+            reset_connection()
             if attempt < max_retries - 1:
                 backoff_time = 2**attempt
                 print(
@@ -359,8 +418,19 @@ def get_users_info_batch(user_ids, batch_size=50, max_parallel=4):
     return users_info
 
 
-def get_user_followings(username, max_following=10000, max_parallel=4):
-    """Get list of users that a user is following using RapidAPI"""
+def get_user_followings(username, max_following=10000, max_parallel=4, known_ids=None):
+    """Get list of users that a user is following using RapidAPI
+
+    Args:
+        username: The username to fetch followings for
+        max_following: Maximum number of following IDs to fetch
+        max_parallel: Maximum number of parallel profile requests
+        known_ids: Optional collection of user IDs (as str) whose profiles are
+            already known; these are not fetched again or returned
+
+    Returns:
+        List of user info dictionaries for the followings not in known_ids
+    """
     print(f"\nFetching followings for @{username}")
 
     following_ids_set = set()  # Track unique IDs
@@ -425,6 +495,15 @@ def get_user_followings(username, max_following=10000, max_parallel=4):
     following_ids_list = list(following_ids_set)
     print(f"  ✓ Found {len(following_ids_list)} unique following IDs for @{username}")
 
+    # Skip profiles we already have from earlier seed users
+    if known_ids:
+        following_ids_list = [
+            uid for uid in following_ids_list if str(uid) not in known_ids
+        ]
+        skipped = len(following_ids_set) - len(following_ids_list)
+        if skipped:
+            print(f"  Skipping {skipped} already known users")
+
     # Fetch full user info for all following IDs using batch endpoint
     print(f"  Fetching full user profiles...")
     following_users = get_users_info_batch(
@@ -447,6 +526,7 @@ def build_master_list(seed_usernames, max_parallel=4):
     print(f"{'=' * 60}")
 
     master_dict = {}  # Use dict to avoid duplicates, keyed by user_id
+    username_index = {}  # Lowercase username -> first user added with it
     seed_users_info = []  # Track seed users separately
 
     for i, username in enumerate(seed_usernames):
@@ -454,29 +534,29 @@ def build_master_list(seed_usernames, max_parallel=4):
 
         try:
             # Get followings for this seed user
-            following_users = get_user_followings(username, max_parallel=max_parallel)
+            following_users = get_user_followings(
+                username, max_parallel=max_parallel, known_ids=master_dict
+            )
 
             # Add this seed user to master list (we need to mark them as seed users)
             # For now, we'll fetch their info when we get their followings
             # The seed user might appear in their followings if they follow themselves
             # or we can add them manually
 
-            # Add all following users to master dict
+            # Add all following users to master dict, indexing usernames as
+            # we go so the seed user lookup below doesn't rescan master_dict
             for user in following_users:
                 user_id = user.get("user_id")
                 if user_id and user_id not in master_dict:
                     master_dict[user_id] = user
+                    username_index.setdefault(user.get("username", "").lower(), user)
 
             # Check if seed user appears in followings
             # If not, we'll need to get their info separately
-            found_seed_user = False
-            for user_id, user in master_dict.items():
-                if user.get("username", "").lower() == username.lower():
-                    seed_users_info.append(user)
-                    found_seed_user = True
-                    break
-
-            if not found_seed_user:
+            seed_user = username_index.get(username.lower())
+            if seed_user:
+                seed_users_info.append(seed_user)
+            else:
                 # Seed user not in their own followings, fetch their info
                 print(f"  Seed user @{username} not in their own followings list")
                 print(f"  Fetching real user info from API...")
@@ -488,6 +568,9 @@ def build_master_list(seed_usernames, max_parallel=4):
                     seed_user_id = seed_user_info["user_id"]
                     print(f"  ✓ Added seed user with real ID: {seed_user_id}")
                     master_dict[seed_user_id] = seed_user_info
+                    username_index.setdefault(
+                        seed_user_info.get("username", "").lower(), seed_user_info
+                    )
                     seed_users_info.append(seed_user_info)
                 else:
                     # Skip this seed user if we can't get their real ID
@@ -534,8 +617,8 @@ def save_seed_followings(master_list, seed_users_info, raw_data_dir, seed_graph_
         "master_list": master_list,
     }
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with open(filename, "wb") as f:
+        f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
     print(f"\n✓ Saved master list to: {filename}")
     print(f"  - Seed users: {len(seed_users_info)}")
@@ -557,6 +640,9 @@ def main():
         if not config:
             return
 
+        # Fail fast on a missing API key before any work is done
+        get_api_headers()
+
         # Get seed user IDs from config [seed_graph] section
         seed_graph_config = config.get("seed_graph", {})
         if not seed_graph_config:
@@ -16,14 +16,17 @@ Uses endpoints:
 Rate limited to 1,000 requests per second to comply with API limits.
 """
 
+import bisect
+import functools
 import http.client
-import json
 import os
+import re
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 
+import orjson
 import toml
 from dotenv import load_dotenv
 
@@ -37,20 +40,23 @@ class RateLimiter:
     def __init__(self, requests_per_second=1000):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second  # Minimum time between requests
-        self.last_request_time = 0
+        self.next_request_time = 0.0  # Earliest time the next request may start
         self.lock = threading.Lock()
 
     def wait_for_token(self):
-        """Wait until enough time has passed since last request"""
-        with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
+        """Wait until enough time has passed since last request
 
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                time.sleep(wait_time)
+        Each caller reserves the next free slot under the lock and then sleeps
+        outside it, so waiting threads don't serialize on the lock.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_request_time)
+            self.next_request_time = slot + self.min_interval
 
-            self.last_request_time = time.time()
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 # Initialize global rate limiter and request counter
@@ -58,9 +64,65 @@ rate_limiter = None
 request_count = 0
 start_time = None
 
+# Keep-alive connection per worker thread (http.client connections aren't
+# thread-safe), so the TCP/TLS handshake is paid once per thread, not per request
+_thread_local = threading.local()
+
+
+def get_connection():
+    """Get this thread's persistent HTTPS connection to the API host"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection("api.twitterapi.io")
+        _thread_local.conn = conn
+    return conn
+
+
+def reset_connection():
+    """Close this thread's connection so the next request opens a fresh one"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+
+# Errors from reusing a kept-alive socket the server has already closed
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def send_get(full_endpoint, headers):
+    """Send a GET on this thread's connection and read the response body
 
+    http.client does not reconnect on its own, so a keep-alive socket that went
+    stale while idle fails on first use. That failure is retried once, right
+    away, on a fresh connection instead of costing a backoff retry.
+
+    Returns:
+        Tuple of (response, body bytes)
+    """
+    try:
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+    except STALE_CONNECTION_ERRORS:
+        reset_connection()
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.toml"""
+    """Load configuration from config.toml
+
+    Cached: both main and load_seed_followings need it.
+    """
     try:
         # Get the directory where this script is located
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -95,6 +157,14 @@ def get_api_key():
     return api_key
 
 
+@functools.lru_cache(maxsize=1)
+def get_api_headers():
+    """Get request headers, reading and cleaning the API key only once"""
+    return {
+        "X-API-Key": get_api_key(),
+    }
+
+
 def make_request(endpoint, params=None, max_retries=3):
     """Make HTTP request to twitterapi.io with rate limiting and exponential backoff"""
     global request_count, start_time
@@ -103,6 +173,9 @@ def make_request(endpoint, params=None, max_retries=3):
     if start_time is None:
         start_time = time.time()
 
+    # Headers are identical across attempts
+    headers = get_api_headers()
+
     for attempt in range(max_retries):
         # Wait for rate limiter before making request
         if rate_limiter:
@@ -120,12 +193,6 @@ def make_request(endpoint, params=None, max_retries=3):
             )
 
         try:
-            conn = http.client.HTTPSConnection("api.twitterapi.io")
-
-            headers = {
-                "X-API-Key": get_api_key(),
-            }
-
             # Build URL with query parameters
             if params:
                 query_string = "&".join([f"{k}={v}" for k, v in params.items()])
@@ -133,14 +200,10 @@ def make_request(endpoint, params=None, max_retries=3):
             else:
                 full_endpoint = endpoint
 
-            conn.request("GET", full_endpoint, headers=headers)
-
-            res = conn.getresponse()
-            data = res.read()
-            conn.close()
+            res, data = send_get(full_endpoint, headers)
 
             if res.status == 200:
-                return json.loads(data.decode("utf-8"))
+                return orjson.loads(data)
             elif res.status == 429:  # Rate limit exceeded
                 if attempt < max_retries - 1:
                     backoff_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
@@ -168,6 +231,8 @@ def make_request(endpoint, params=None, max_retries=3):
                 return None
 
         except Exception as e:
+            # The connection may be stale or half-used; reconnect on retry
+            reset_connection()
             if attempt < max_retries - 1:
                 backoff_time = 2**attempt
                 print(
@@ -182,6 +247,12 @@ def make_request(endpoint, params=None, max_retries=3):
     return None
 
 
+def user_id_to_int(user_id):
+    """Convert a user_id to int, treating missing or non-numeric IDs as 0"""
+    user_id = str(user_id)
+    return int(user_id) if user_id.isdigit() else 0
+
+
 def load_seed_followings(raw_data_dir):
     """Load the seed followings master list for the seed_graph from config"""
     # Load config to get seed_graph name
@@ -213,18 +284,15 @@ def load_seed_followings(raw_data_dir):
         return None, None
 
     try:
-        with open(filename, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filename, "rb") as f:
+            data = orjson.loads(f.read())
 
         master_list = data.get("master_list", [])
         seed_users = data.get("seed_users", [])
 
         # Sort master_list by user_id (as integer, from lowest to highest)
         master_list_sorted = sorted(
-            master_list,
-            key=lambda u: int(u.get("user_id", 0))
-            if u.get("user_id", "").isdigit()
-            else 0,
+            master_list, key=lambda u: user_id_to_int(u.get("user_id", ""))
         )
 
         print(f"Loaded seed followings from {filename}")
@@ -239,20 +307,72 @@ def load_seed_followings(raw_data_dir):
         return None, None
 
 
-def is_post_within_days(created_at_str, days_back):
-    """Check if post is within the specified days back"""
+TWITTER_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+def parse_twitter_date(created_at_str):
+    """Parse Twitter's "Wed Nov 12 15:59:13 +0000 2025" format without strptime
+
+    Returns:
+        Aware datetime, or None if the string is not in that exact layout
+    """
+    if len(created_at_str) != 30 or created_at_str[20] not in "+-":
+        return None
+    month = TWITTER_MONTHS.get(created_at_str[4:7])
+    if not month:
+        return None
+    try:
+        offset = timedelta(
+            hours=int(created_at_str[21:23]), minutes=int(created_at_str[23:25])
+        )
+        if created_at_str[20] == "-":
+            offset = -offset
+        return datetime(
+            int(created_at_str[26:30]),
+            month,
+            int(created_at_str[8:10]),
+            int(created_at_str[11:13]),
+            int(created_at_str[14:16]),
+            int(created_at_str[17:19]),
+            tzinfo=timezone.utc if not offset else timezone(offset),
+        )
+    except ValueError:
+        return None
+
+
+def parse_post_date(created_at_str):
+    """Parse a post's createdAt string in any of the formats the API returns
+
+    Returns:
+        Aware datetime, or None if the string is missing or not recognised
+    """
     try:
         if not created_at_str:
-            return False
+            return None
 
         # Try multiple date formats
-        post_date = None
+        # Fast path: Twitter's old format "Wed Nov 12 15:59:13 +0000 2025"
+        post_date = parse_twitter_date(created_at_str)
 
-        # Format 1: Twitter's old format "Wed Nov 12 15:59:13 +0000 2025"
-        try:
-            post_date = datetime.strptime(created_at_str, "%a %b %d %H:%M:%S %z %Y")
-        except:
-            pass
+        # Format 1: Twitter's old format, via strptime for anything irregular
+        if not post_date:
+            try:
+                post_date = datetime.strptime(created_at_str, "%a %b %d %H:%M:%S %z %Y")
+            except:
+                pass
 
         # Format 2: ISO 8601 with milliseconds "2024-01-15T10:30:45.123Z"
         if not post_date and "." in created_at_str:
@@ -270,15 +390,39 @@ def is_post_within_days(created_at_str, days_back):
             except:
                 pass
 
-        if not post_date:
-            return False
+        return post_date
+    except Exception as e:
+        return None
 
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-        return post_date >= cutoff_date
-    except Exception as e:
+def is_post_within_days(created_at_str, cutoff_date):
+    """Check if post was created at or after cutoff_date (an aware datetime)"""
+    post_date = parse_post_date(created_at_str)
+    if not post_date:
         return False
 
+    return post_date >= cutoff_date
+
+
+def extract_embedded_post(embedded):
+    """Extract the summary kept for a retweeted or quoted tweet
+
+    Args:
+        embedded: The retweeted_tweet or quoted_tweet dict from the API
+
+    Returns:
+        Tuple of (author dict, post summary dict)
+    """
+    author = embedded.get("author") or {}
+    return author, {
+        "post_id": embedded.get("id", ""),
+        "text": embedded.get("text", ""),
+        "created_at": embedded.get("createdAt", ""),
+        "user_id": author.get("id", ""),
+        "username": author.get("userName", ""),
+        "user_display_name": author.get("name", ""),
+    }
+
 
 def extract_post_data(tweet):
     """Extract relevant data from a tweet using new API format"""
@@ -287,28 +431,34 @@ def extract_post_data(tweet):
 
     try:
         # New API format is much simpler
-        author = tweet.get("author", {})
+        # (.get(key) rather than .get(key, {}) avoids building a default dict
+        # on every call; a missing value is replaced only when needed.
+        # tweet.get is bound once since it is called for most fields below)
+        get = tweet.get
+        author = get("author")
         if not isinstance(author, dict):
             author = {}
 
-        # Determine post type
-        is_reply = tweet.get("isReply", False)
-        is_retweet = "retweeted_tweet" in tweet and tweet.get("retweeted_tweet")
-        is_quote = "quoted_tweet" in tweet and tweet.get("quoted_tweet")
+        # Determine post type (stored as plain bools, not the embedded tweet dicts)
+        is_reply = get("isReply", False)
+        retweeted = get("retweeted_tweet")
+        quoted = get("quoted_tweet")
+        is_retweet = bool(retweeted)
+        is_quote = bool(quoted)
 
         # Basic post information
         extracted_data = {
-            "post_id": tweet.get("id", ""),
-            "text": tweet.get("text", ""),
-            "created_at": tweet.get("createdAt", ""),
+            "post_id": get("id", ""),
+            "text": get("text", ""),
+            "created_at": get("createdAt", ""),
             "user_id": author.get("id", ""),
             "username": author.get("userName", ""),
             "is_retweet": is_retweet,
             "is_reply": is_reply,
             "is_quote": is_quote,
-            "reply_to_post_id": tweet.get("inReplyToId"),
-            "reply_to_user_id": tweet.get("inReplyToUserId"),
-            "reply_to_username": tweet.get("inReplyToUsername"),
+            "reply_to_post_id": get("inReplyToId"),
+            "reply_to_user_id": get("inReplyToUserId"),
+            "reply_to_username": get("inReplyToUsername"),
             "retweeted_post_id": None,
             "quoted_post_id": None,
             "original_post_creator_id": None,
@@ -317,43 +467,19 @@ def extract_post_data(tweet):
 
         # Extract retweeted post data if available
         if is_retweet:
-            retweeted = tweet.get("retweeted_tweet", {})
-            if retweeted:
-                rt_author = retweeted.get("author", {})
-                extracted_data["retweeted_post_id"] = retweeted.get("id")
-                extracted_data["original_post_creator_id"] = rt_author.get("id")
-                extracted_data["original_post_creator_username"] = rt_author.get(
-                    "userName"
-                )
-
-                extracted_data["retweeted_post"] = {
-                    "post_id": retweeted.get("id", ""),
-                    "text": retweeted.get("text", ""),
-                    "created_at": retweeted.get("createdAt", ""),
-                    "user_id": rt_author.get("id", ""),
-                    "username": rt_author.get("userName", ""),
-                    "user_display_name": rt_author.get("name", ""),
-                }
+            rt_author, extracted_data["retweeted_post"] = extract_embedded_post(
+                retweeted
+            )
+            extracted_data["retweeted_post_id"] = retweeted.get("id")
+            extracted_data["original_post_creator_id"] = rt_author.get("id")
+            extracted_data["original_post_creator_username"] = rt_author.get("userName")
 
         # Extract quoted post data if available
         if is_quote:
-            quoted = tweet.get("quoted_tweet", {})
-            if quoted:
-                qt_author = quoted.get("author", {})
-                extracted_data["quoted_post_id"] = quoted.get("id")
-                extracted_data["original_post_creator_id"] = qt_author.get("id")
-                extracted_data["original_post_creator_username"] = qt_author.get(
-                    "userName"
-                )
-
-                extracted_data["quoted_post"] = {
-                    "post_id": quoted.get("id", ""),
-                    "text": quoted.get("text", ""),
-                    "created_at": quoted.get("createdAt", ""),
-                    "user_id": qt_author.get("id", ""),
-                    "username": qt_author.get("userName", ""),
-                    "user_display_name": qt_author.get("name", ""),
-                }
+            qt_author, extracted_data["quoted_post"] = extract_embedded_post(quoted)
+            extracted_data["quoted_post_id"] = quoted.get("id")
+            extracted_data["original_post_creator_id"] = qt_author.get("id")
+            extracted_data["original_post_creator_username"] = qt_author.get("userName")
 
         return extracted_data
 
@@ -362,15 +488,20 @@ def extract_post_data(tweet):
         return None
 
 
-def get_user_tweets(username, user_id, days_back, max_tweets=1000):
-    """Get user's tweets and replies using the /twitter/user/last_tweets endpoint"""
-    content = []
+def get_user_tweets(username, user_id, cutoff_date, max_tweets=1000):
+    """Get user's tweets and replies using the /twitter/user/last_tweets endpoint
+
+    Returns:
+        Tuple of (posts, replies) lists, split as each tweet is extracted
+    """
+    posts = []
+    replies = []
     cursor = None
     page = 0
 
     print(f"  Fetching tweets for @{username} (ID: {user_id})...")
 
-    while len(content) < max_tweets and page < 10:  # Limit pages
+    while len(posts) + len(replies) < max_tweets and page < 10:  # Limit pages
         page += 1
 
         params = {"userId": user_id, "includeReplies": "true"}
@@ -413,19 +544,34 @@ def get_user_tweets(username, user_id, days_back, max_tweets=1000):
             if not tweets:
                 break
 
+            # Tweets come newest first, so when the page's first and last
+            # tweets are both in range and in that order, the whole page is
+            # and the per-tweet check is skipped. An older pinned tweet at the
+            # top breaks the order and falls back to checking every tweet.
+            first_date = parse_post_date(tweets[0].get("createdAt"))
+            last_date = parse_post_date(tweets[-1].get("createdAt"))
+            page_in_range = (
+                first_date is not None
+                and last_date is not None
+                and first_date >= last_date >= cutoff_date
+            )
+
             for tweet in tweets:
                 # Check if within date range
-                created_at = tweet.get("createdAt")
-
-                if is_post_within_days(created_at, days_back):
+                if page_in_range or is_post_within_days(
+                    tweet.get("createdAt"), cutoff_date
+                ):
                     extracted = extract_post_data(tweet)
                     if extracted:
-                        content.append(extracted)
+                        if extracted["is_reply"]:
+                            replies.append(extracted)
+                        else:
+                            posts.append(extracted)
                         found_content = True
                 else:
                     # If we hit content outside date range, stop
                     print(f"    Reached content outside date range for @{username}")
-                    return content
+                    return posts, replies
 
         except Exception as e:
             print(
@@ -445,15 +591,13 @@ def get_user_tweets(username, user_id, days_back, max_tweets=1000):
         if not cursor:
             break
 
-        print(
-            f"    Page {page}: Found {len([c for c in content if c]) if content else 0} posts"
-        )
+        print(f"    Page {page}: Found {len(posts) + len(replies)} posts")
 
-    print(f"  Total tweets: {len(content)} posts for @{username}")
-    return content
+    print(f"  Total tweets: {len(posts) + len(replies)} posts for @{username}")
+    return posts, replies
 
 
-def fetch_user_interactions(user, days_back, post_limit):
+def fetch_user_interactions(user, cutoff_date, post_limit):
     """Fetch all interactions for a single user"""
     username = user.get("username", "")
     user_id = user.get("user_id", "")
@@ -463,25 +607,19 @@ def fetch_user_interactions(user, days_back, post_limit):
 
     print(f"\nProcessing user: @{username}")
 
+    # Get user's tweets and replies (one endpoint, split by is_reply as fetched)
+    posts, replies = get_user_tweets(
+        username, user_id, cutoff_date, max_tweets=post_limit
+    )
+
     user_data = {
         "username": username,
         "user_id": user_id,
         "display_name": user.get("display_name", ""),
-        "posts": [],
-        "replies": [],
+        "posts": posts,
+        "replies": replies,
     }
 
-    # Get user's tweets and replies (now combined in one endpoint)
-    all_content = get_user_tweets(username, user_id, days_back, max_tweets=post_limit)
-
-    # Separate posts and replies based on is_reply flag
-    for item in all_content:
-        if item:
-            if item.get("is_reply"):
-                user_data["replies"].append(item)
-            else:
-                user_data["posts"].append(item)
-
     print(
         f"  Found {len(user_data['posts'])} posts and {len(user_data['replies'])} replies"
     )
@@ -491,46 +629,74 @@ def fetch_user_interactions(user, days_back, post_limit):
 
 def get_processed_user_id_ranges_from_batch_files(raw_data_dir, seed_graph_name):
     """Get list of (first_user_id, last_user_id) ranges by parsing batch filenames only"""
-    import glob
-
-    pattern = os.path.join(raw_data_dir, f"{seed_graph_name}_*_*.json")
-    matching_files = glob.glob(pattern)
-
-    # Exclude the followings file from matching
-    followings_file = os.path.join(raw_data_dir, f"{seed_graph_name}_followings.json")
+    # Format: [seed_graph]_[first_user_id]_[last_user_id].json
+    # (the followings files don't match the numeric IDs)
+    filename_pattern = re.compile(rf"{re.escape(seed_graph_name)}_(\d+)_(\d+)\.json$")
 
     processed_ranges = []
 
-    for file_path in matching_files:
-        if file_path == followings_file:
-            continue
-
-        # Extract first and last user IDs from filename
-        # Format: [seed_graph]_[first_user_id]_[last_user_id].json
-        basename = os.path.basename(file_path)
-        # Remove .json extension
-        name_without_ext = basename.rsplit(".json", 1)[0]
-        # Remove seed_graph prefix
-        prefix = f"{seed_graph_name}_"
-        if name_without_ext.startswith(prefix):
-            rest = name_without_ext[len(prefix) :]
-            # Split by underscore to get first and last user IDs
-            parts = rest.rsplit("_", 1)
-            if len(parts) == 2:
-                first_id, last_id = parts
-                if first_id.isdigit() and last_id.isdigit():
-                    processed_ranges.append((int(first_id), int(last_id)))
+    # Single directory scan; only entry names are needed, no per-file stat
+    try:
+        with os.scandir(raw_data_dir) as entries:
+            for entry in entries:
+                match = filename_pattern.match(entry.name)
+                if match:
+                    processed_ranges.append((int(match.group(1)), int(match.group(2))))
+    except FileNotFoundError:
+        pass
 
     return processed_ranges
 
 
+def merge_id_ranges(ranges):
+    """Sort (first_id, last_id) ranges and merge any that overlap"""
+    merged = []
+    for first_id, last_id in sorted(ranges):
+        if merged and first_id <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last_id))
+        else:
+            merged.append((first_id, last_id))
+    return merged
+
+
 def is_user_in_processed_ranges(user_id, processed_ranges):
-    """Check if a user_id falls within any of the processed ranges"""
-    user_id_int = int(user_id) if str(user_id).isdigit() else 0
-    for first_id, last_id in processed_ranges:
-        if first_id <= user_id_int <= last_id:
-            return True
-    return False
+    """Check if a user_id falls within any of the processed ranges
+
+    processed_ranges must be sorted and non-overlapping (see merge_id_ranges),
+    so the containing range can be found by binary search.
+    """
+    user_id_int = user_id_to_int(user_id)
+    idx = bisect.bisect_right(processed_ranges, (user_id_int, float("inf"))) - 1
+    return idx >= 0 and user_id_int <= processed_ranges[idx][1]
+
+
+def write_json_streaming(f, data, stream_key):
+    """Write data as indented JSON, serializing data[stream_key] item by item
+
+    The document is never held as one bytes object in memory. Output is
+    identical to orjson.dumps(data, option=orjson.OPT_INDENT_2).
+    """
+    if not data:
+        f.write(b"{}")
+        return
+
+    f.write(b"{")
+    for i, (key, value) in enumerate(data.items()):
+        f.write(b",\n  " if i else b"\n  ")
+        f.write(orjson.dumps(key))
+        f.write(b": ")
+        if key == stream_key and value:
+            f.write(b"[")
+            for j, item in enumerate(value):
+                f.write(b",\n    " if j else b"\n    ")
+                # JSON strings escape newlines, so every raw newline is layout
+                item_json = orjson.dumps(item, option=orjson.OPT_INDENT_2)
+                f.write(item_json.replace(b"\n", b"\n    "))
+            f.write(b"\n  ]")
+        else:
+            value_json = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+            f.write(value_json.replace(b"\n", b"\n  "))
+    f.write(b"\n}")
 
 
 def save_batch_interactions(
@@ -551,12 +717,15 @@ def save_batch_interactions(
         "users": batch_interactions,
     }
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    with open(filename, "wb") as f:
+        write_json_streaming(f, output_data, "users")
 
-    # Calculate stats
-    total_posts = sum(len(u.get("posts", [])) for u in batch_interactions)
-    total_replies = sum(len(u.get("replies", [])) for u in batch_interactions)
+    # Calculate stats in a single pass over the batch
+    total_posts = 0
+    total_replies = 0
+    for u in batch_interactions:
+        total_posts += len(u.get("posts", []))
+        total_replies += len(u.get("replies", []))
 
     print(f"\n✓ Saved batch to: {filename}")
     print(f"  - Users in batch: {len(batch_interactions)}")
@@ -579,6 +748,9 @@ def main():
         if not config:
             return
 
+        # Fail fast on a missing API key before any work is done
+        get_api_headers()
+
         # Initialize rate limiter with config values
         requests_per_second = config.get("rate_limiting", {}).get(
             "requests_per_second", 1000
@@ -604,6 +776,9 @@ def main():
         days_back = config.get("data", {}).get("days_back", 365)
         post_limit_per_user = config.get("data", {}).get("post_limit_per_user", 500)
 
+        # Posts older than this are skipped; computed once for the whole run
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
+
         print(f"Configuration:")
         print(f"  - Days back: {days_back}")
         print(f"  - Post limit per user: {post_limit_per_user}")
@@ -616,9 +791,10 @@ def main():
             return
 
         # Get already processed user ID ranges from existing batch filenames
-        processed_ranges = get_processed_user_id_ranges_from_batch_files(
+        batch_ranges = get_processed_user_id_ranges_from_batch_files(
             raw_data_dir, seed_graph_name
         )
+        processed_ranges = merge_id_ranges(batch_ranges)
 
         # Filter out already processed users
         remaining_users = [
@@ -630,7 +806,7 @@ def main():
         already_processed_count = len(master_list) - len(remaining_users)
         print(f"\nTotal users in master list: {len(master_list)}")
         print(
-            f"Already processed (from {len(processed_ranges)} batch files): {already_processed_count}"
+            f"Already processed (from {len(batch_ranges)} batch files): {already_processed_count}"
         )
         print(f"Remaining to process: {len(remaining_users)}")
 
@@ -667,7 +843,7 @@ def main():
                 # Submit all users in batch
                 future_to_user = {
                     executor.submit(
-                        fetch_user_interactions, user, days_back, post_limit_per_user
+                        fetch_user_interactions, user, cutoff_date, post_limit_per_user
                     ): user
                     for user in batch_users
                 }
@@ -9,20 +9,23 @@ This script fetches usernames for all user IDs in the scores CSV:
 4. Saves to raw/[seed_graph]_usernames.csv
 
 Uses endpoints:
-- /get-users-v2 to get user information for multiple user IDs (batch of 50)
+- /get-users-v2 to get user information for multiple user IDs
+  (batch size from users_batch_size in config, default 100)
 
 Rate limited to comply with API limits.
 """
 
 import csv
+import functools
 import http.client
-import json
 import os
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
+import pandas as pd
 import toml
 from dotenv import load_dotenv
 
@@ -36,20 +39,23 @@ class RateLimiter:
     def __init__(self, requests_per_second=10):
         self.requests_per_second = requests_per_second
         self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.next_request_time = 0.0  # Earliest time the next request may start
         self.lock = threading.Lock()
 
     def wait_for_token(self):
-        """Wait until enough time has passed since last request"""
-        with self.lock:
-            now = time.time()
-            time_since_last = now - self.last_request_time
+        """Wait until enough time has passed since last request
 
-            if time_since_last < self.min_interval:
-                wait_time = self.min_interval - time_since_last
-                time.sleep(wait_time)
+        Each caller reserves the next free slot under the lock and then sleeps
+        outside it, so waiting threads don't serialize on the lock.
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_request_time)
+            self.next_request_time = slot + self.min_interval
 
-            self.last_request_time = time.time()
+        wait_time = slot - now
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 # Initialize global rate limiter and request counter
@@ -57,6 +63,58 @@ rate_limiter = None
 request_count = 0
 start_time = None
 
+# Keep-alive connection per worker thread (http.client connections aren't
+# thread-safe), so the TCP/TLS handshake is paid once per thread, not per request
+_thread_local = threading.local()
+
+
+def get_connection():
+    """Get this thread's persistent HTTPS connection to the API host"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is None:
+        conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
+        _thread_local.conn = conn
+    return conn
+
+
+def reset_connection():
+    """Close this thread's connection so the next request opens a fresh one"""
+    conn = getattr(_thread_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _thread_local.conn = None
+
+
+# Errors from reusing a kept-alive socket the server has already closed
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def send_get(full_endpoint, headers):
+    """Send a GET on this thread's connection and read the response body
+
+    http.client does not reconnect on its own, so a keep-alive socket that went
+    stale while idle fails on first use. That failure is retried once, right
+    away, on a fresh connection instead of costing a backoff retry.
+
+    Returns:
+        Tuple of (response, body bytes)
+    """
+    try:
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+    except STALE_CONNECTION_ERRORS:
+        reset_connection()
+        conn = get_connection()
+        conn.request("GET", full_endpoint, headers=headers)
+        res = conn.getresponse()
+        return res, res.read()
+
 
 def load_config():
     """Load configuration from config.toml"""
@@ -92,6 +150,15 @@ def get_api_key():
     return api_key
 
 
+@functools.lru_cache(maxsize=1)
+def get_api_headers():
+    """Get request headers, reading and cleaning the API key only once"""
+    return {
+        "x-rapidapi-key": get_api_key(),
+        "x-rapidapi-host": "twitter241.p.rapidapi.com",
+    }
+
+
 def make_request(endpoint, params="", max_retries=3):
     """Make HTTP request to RapidAPI with rate limiting and exponential backoff"""
     global request_count, start_time
@@ -99,6 +166,9 @@ def make_request(endpoint, params="", max_retries=3):
     if start_time is None:
         start_time = time.time()
 
+    # Headers are identical across attempts
+    headers = get_api_headers()
+
     for attempt in range(max_retries):
         if rate_limiter:
             rate_limiter.wait_for_token()
@@ -113,23 +183,12 @@ def make_request(endpoint, params="", max_retries=3):
             )
 
         try:
-            conn = http.client.HTTPSConnection("twitter241.p.rapidapi.com")
-
-            headers = {
-                "x-rapidapi-key": get_api_key(),
-                "x-rapidapi-host": "twitter241.p.rapidapi.com",
-            }
-
             full_endpoint = f"{endpoint}?{params}" if params else endpoint
 
-            conn.request("GET", full_endpoint, headers=headers)
-
-            res = conn.getresponse()
-            data = res.read()
-            conn.close()
+            res, data = send_get(full_endpoint, headers)
 
             if res.status == 200:
-                return json.loads(data.decode("utf-8"))
+                return orjson.loads(data)
             elif res.status == 429:
                 if attempt < max_retries - 1:
                     backoff_time = 2**attempt
@@ -158,6 +217,8 @@ def make_request(endpoint, params="", max_retries=3):
                 return None
 
         except Exception as e:
+            # The connection may be stale or half-used; reconnect on retry
+            reset_connection()
             if attempt < max_retries - 1:
                 backoff_time = 2**attempt
                 print(
@@ -235,13 +296,15 @@ def load_scores_file(scores_dir, seed_graph_name):
 
     print(f"Loading {filename}...")
 
-    user_ids = []
-    with open(filename, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            user_id = row.get("i", "").strip()
-            if user_id:
-                user_ids.append(user_id)
+    # Only the user ID column is needed; keep IDs as strings (no float/NaN coercion)
+    try:
+        df = pd.read_csv(filename, usecols=["i"], dtype=str, keep_default_na=False)
+    except ValueError as e:
+        print(f"Error reading {filename}: {e}")
+        return None
+
+    ids = df["i"].str.strip()
+    user_ids = ids[ids != ""].tolist()
 
     print(f"  Loaded {len(user_ids)} user IDs from scores")
     return user_ids
@@ -298,6 +361,9 @@ def main():
         if not config:
             return
 
+        # Fail fast on a missing API key before any work is done
+        get_api_headers()
+
         # Get seed graph name from config
         seed_graph_config = config.get("seed_graph", {})
         if not seed_graph_config:
@@ -334,6 +400,19 @@ def main():
         # Get max parallel requests from config
         max_parallel = config.get("rate_limiting", {}).get("max_parallel_requests", 4)
 
+        # Get number of user IDs per /get-users-v2 request from config
+        batch_size = config.get("rate_limiting", {}).get("users_batch_size", 100)
+        if (
+            isinstance(batch_size, bool)
+            or not isinstance(batch_size, int)
+            or batch_size < 1
+        ):
+            print(
+                f"Warning: users_batch_size must be a positive integer, "
+                f"got {batch_size!r}; using 100"
+            )
+            batch_size = 100
+
         # Reset counters
         request_count = 0
         start_time = None
@@ -345,10 +424,10 @@ def main():
         print(f"Total users to fetch: {len(user_ids_to_fetch)}")
         print(f"Rate limiting: {requests_per_second} requests/second")
         print(f"Max parallel requests: {max_parallel}")
+        print(f"Users per request: {batch_size}")
         print(f"{'=' * 60}\n")
 
-        # Create batches of 100 users
-        batch_size = 100
+        # Create batches of batch_size users
         total_batches = (len(user_ids_to_fetch) + batch_size - 1) // batch_size
 
         batches = []
@@ -10,7 +10,6 @@ This script generates seed CSV files for EigenTrust:
 5. Saves CSV to seed/[seed_graph].csv with format: i,v where scores sum to 1.0
 """
 
-import glob
 import os
 import re
 
@@ -60,36 +59,29 @@ def get_interaction_file_range(raw_data_dir, seed_graph_name):
         Tuple of (lowest_id, highest_id) as integers, or (None, None) if no files found
     """
     # Pattern: {seed_graph_name}_{id1}_{id2}.json
-    pattern = os.path.join(raw_data_dir, f"{seed_graph_name}_*_*.json")
-    matching_files = glob.glob(pattern)
-
-    # Exclude followings and extended_followings files
-    interaction_files = [
-        f
-        for f in matching_files
-        if not f.endswith("_followings.json")
-        and not f.endswith("_extended_followings.json")
-    ]
-
-    if not interaction_files:
-        return None, None
-
-    # Extract user IDs from filenames
-    all_ids = []
+    # (followings and extended_followings files don't match the numeric IDs)
     filename_pattern = re.compile(rf"{re.escape(seed_graph_name)}_(\d+)_(\d+)\.json$")
 
-    for filepath in interaction_files:
-        filename = os.path.basename(filepath)
-        match = filename_pattern.match(filename)
-        if match:
-            id1 = int(match.group(1))
-            id2 = int(match.group(2))
-            all_ids.extend([id1, id2])
-
-    if not all_ids:
+    # Single directory scan, tracking the range as we go
+    lowest_id = None
+    highest_id = None
+    try:
+        with os.scandir(raw_data_dir) as entries:
+            for entry in entries:
+                match = filename_pattern.match(entry.name)
+                if not match:
+                    continue
+                id1 = int(match.group(1))
+                id2 = int(match.group(2))
+                low, high = (id1, id2) if id1 <= id2 else (id2, id1)
+                if lowest_id is None or low < lowest_id:
+                    lowest_id = low
+                if highest_id is None or high > highest_id:
+                    highest_id = high
+    except FileNotFoundError:
         return None, None
 
-    return min(all_ids), max(all_ids)
+    return lowest_id, highest_id
 
 
 def filter_seed_ids(seed_ids, lowest_id, highest_id):
@@ -32,18 +32,29 @@ as there is no concept of "community posts" in the seed graph context.
 """
 
 import csv
+import functools
 import glob
-import json
 import os
 import re
-from collections import defaultdict
+import sys
+from collections import ChainMap, defaultdict
 from datetime import datetime
 
+import ijson
+import orjson
 import toml
 
+# Twitter handles are ASCII; the lookahead skips "@café"-style text, which can't
+# be a real username
+MENTION_RE = re.compile(r"@([A-Za-z0-9_]+)(?!\w)")
 
+
+@functools.lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.toml"""
+    """Load configuration from config.toml
+
+    Cached, so main and the get_*_from_config helpers share a single parse.
+    """
     try:
         # Get the directory where this script is located
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -93,8 +104,8 @@ def load_json_file(file_path):
         return None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
         print(f"✓ Loaded {os.path.basename(file_path)}")
         return data
     except Exception as e:
@@ -102,18 +113,92 @@ def load_json_file(file_path):
         return None
 
 
+def iter_json_items(file_path, prefix):
+    """Stream the items found at prefix (e.g. "users.item") from a JSON file
+
+    Items are parsed one at a time with ijson, so the whole document is never
+    held in memory. Parse errors are reported and re-raised, so callers can
+    discard whatever was read from a truncated or corrupt file.
+    """
+    if not os.path.exists(file_path):
+        print(f"⚠️  File not found: {file_path}")
+        return
+
+    try:
+        with open(file_path, "rb") as f:
+            print(f"✓ Streaming {os.path.basename(file_path)}")
+            yield from ijson.items(f, prefix, use_float=True)
+    except Exception as e:
+        print(f"❌ Error loading {file_path}: {e}")
+        raise
+
+
+class StagedSet(set):
+    """Set of new items whose membership tests also consult a base set
+
+    add() only records items here, so a file's dedupe keys can be merged into
+    the base set once that file has been read completely.
+    """
+
+    def __init__(self, base):
+        super().__init__()
+        self.base = base
+
+    def __contains__(self, item):
+        return item in self.base or super().__contains__(item)
+
+
+def read_file_interactions(interactions):
+    """Drain the interaction stream of one raw file
+
+    The file's tuples are buffered so nothing from it reaches the trust matrix
+    until it has parsed completely. This holds one file's interaction tuples
+    (not its parsed users) at a time, so the process_* generators stay lazy
+    across files but not within one.
+
+    Returns:
+        List of interaction tuples, or None if the file could not be read or
+        parsed (the error itself is reported by iter_json_items)
+    """
+    try:
+        return list(interactions)
+    except (ijson.JSONError, OSError):
+        return None
+
+
+def register_usernames(users, username_to_id):
+    """Yield users unchanged while adding their username->user_id mapping"""
+    for user in users:
+        username = normalize_username(user.get("username", ""))
+        user_id = normalize_user_id(user.get("user_id", ""))
+        if username and user_id:
+            username_to_id[username] = user_id
+        yield user
+
+
 def normalize_username(username):
-    """Normalize username by removing @ and converting to lowercase"""
+    """Normalize username by removing @ and converting to lowercase
+
+    The result is interned so repeated usernames share one string object,
+    making dict lookups on them hash-cached identity comparisons.
+    """
     if not username:
         return ""
-    return username.lower().strip().lstrip("@")
+    # Handles usually arrive lowercase already; avoid copying them again
+    if not username.islower():
+        username = username.lower()
+    return sys.intern(username.strip().lstrip("@"))
 
 
 def normalize_user_id(user_id):
-    """Normalize user_id to string format"""
+    """Normalize user_id to string format
+
+    The result is interned so the (source, target) keys of the trust matrix
+    compare by identity during aggregation.
+    """
     if not user_id:
         return ""
-    return str(user_id).strip()
+    return sys.intern(str(user_id).strip())
 
 
 def build_username_to_id_map(
@@ -198,11 +283,12 @@ def build_username_to_id_map_from_raw(
 
 def extract_mentions(text):
     """Extract mentioned usernames from text"""
-    if not text:
+    # Most posts mention nobody; skip the regex when there is no "@" at all
+    if not text or "@" not in text:
         return []
 
     # Find all @mentions in the text
-    mentions = re.findall(r"@(\w+)", text)
+    mentions = MENTION_RE.findall(text)
     return [normalize_username(mention) for mention in mentions]
 
 
@@ -216,10 +302,12 @@ def process_seed_followings(
         trust_weights: Weight configuration
         seen_follows: Set of (source, target) tuples to track duplicate follows
         username_to_id: Mapping from username to user_id
+
+    Yields:
+        (type, source, target, weight) interaction tuples
     """
-    interactions = []
     if not followings_data:
-        return interactions
+        return
 
     follow_weight = trust_weights.get("follow", 30)
     print(f"  Processing seed_followings.json with weight {follow_weight}")
@@ -230,7 +318,14 @@ def process_seed_followings(
 
     if not seed_users or not master_list:
         print(f"    No seed users or master list found")
-        return interactions
+        return
+
+    # Normalize master list IDs once rather than once per seed user
+    master_user_ids = []
+    for master_user in master_list:
+        master_user_id = normalize_user_id(master_user.get("user_id", ""))
+        if master_user_id:
+            master_user_ids.append(master_user_id)
 
     # Create follow relationships from seed users to master list users
     follow_count = 0
@@ -240,27 +335,18 @@ def process_seed_followings(
             continue
 
         # Each seed user follows all users in master_list
-        for master_user in master_list:
-            master_user_id = normalize_user_id(master_user.get("user_id", ""))
-            if master_user_id and seed_user_id != master_user_id:
+        for master_user_id in master_user_ids:
+            if seed_user_id != master_user_id:
                 # Check for duplicates
                 follow_pair = (seed_user_id, master_user_id)
                 if follow_pair not in seen_follows:
                     seen_follows.add(follow_pair)
-                    interactions.append(
-                        {
-                            "type": "follow",
-                            "source": seed_user_id,
-                            "target": master_user_id,
-                            "weight": follow_weight,
-                        }
-                    )
+                    yield ("follow", seed_user_id, master_user_id, follow_weight)
                     follow_count += 1
 
     print(
         f"    Found {follow_count} unique follow relationships (seed users -> master_list)"
     )
-    return interactions
 
 
 def process_seed_extended_followings(
@@ -272,26 +358,27 @@ def process_seed_extended_followings(
         seed_extended_data: The extended followings data structure
         trust_weights: Weight configuration
         seen_follows: Set of (source, target) tuples to track duplicate follows
+
+    Yields:
+        (type, source, target, weight) interaction tuples
     """
-    interactions = []
     if seen_follows is None:
         seen_follows = set()
     if not seed_extended_data:
-        return interactions
+        return
 
     follow_weight = trust_weights.get("follow", 30)
     print(f"  Processing seed_extended_followings.json with weight {follow_weight}")
 
+    # "users" may be a list or a stream of user dicts
     users = seed_extended_data.get("users", [])
-    if not users:
-        print(f"    No users found")
-        return interactions
 
     follow_count = 0
-    total_users = len(users)
+    user_count = 0
     for idx, user in enumerate(users):
+        user_count += 1
         if (idx + 1) % 100 == 0 or idx == 0:
-            print(f"    Processing user {idx + 1}/{total_users}...")
+            print(f"    Processing user {idx + 1}...")
 
         follower_id = normalize_user_id(user.get("user_id", ""))
         if not follower_id:
@@ -305,22 +392,38 @@ def process_seed_extended_followings(
                 follow_pair = (follower_id, followed_id_str)
                 if follow_pair not in seen_follows:
                     seen_follows.add(follow_pair)
-                    interactions.append(
-                        {
-                            "type": "follow",
-                            "source": follower_id,
-                            "target": followed_id_str,
-                            "weight": follow_weight,
-                        }
-                    )
+                    yield ("follow", follower_id, followed_id_str, follow_weight)
                     follow_count += 1
 
+    if not user_count:
+        print(f"    No users found")
+        return
+
     print(f"    Found {follow_count} unique follow relationships")
-    return interactions
+
+
+def resolve_username(
+    username, username_to_id, pending, interaction_type, source, weight
+):
+    """Look up a username target, deferring unknown names when a pending list is given
+
+    Known names resolve on the spot, so only names not yet in username_to_id
+    are queued for resolve_pending_interactions.
+
+    Returns the resolved user_id, or "" if the lookup was deferred or failed.
+    """
+    target = username_to_id.get(username, "")
+    if not target and pending is not None and username:
+        pending.append((interaction_type, source, username, weight))
+    return target
 
 
 def process_seed_interactions(
-    interactions_data, trust_weights, seen_posts=None, username_to_id=None
+    interactions_data,
+    trust_weights,
+    seen_posts=None,
+    username_to_id=None,
+    pending=None,
 ):
     """Process seed user interactions to extract various interaction types
 
@@ -329,14 +432,19 @@ def process_seed_interactions(
         trust_weights: Weight configuration
         seen_posts: Set of post_ids to track duplicate posts/replies
         username_to_id: Mapping from username to user_id
+        pending: Optional list collecting (type, source, username, weight) entries
+            whose target username is not yet in username_to_id; when given, those
+            lookups are deferred to resolve_pending_interactions
+
+    Yields:
+        (type, source, target, weight) interaction tuples
     """
-    interactions = []
     if seen_posts is None:
         seen_posts = set()
     if username_to_id is None:
         username_to_id = {}
     if not interactions_data or "users" not in interactions_data:
-        return interactions
+        return
 
     mention_weight = trust_weights.get("mention", 30)
     reply_weight = trust_weights.get("reply", 20)
@@ -349,17 +457,25 @@ def process_seed_interactions(
     )
     print(f"    No weight multipliers applied (seed graph has no community concept)")
 
-    interaction_counts = defaultdict(int)
+    # Plain local counters keep dict hashing out of the per-post loop
+    retweet_count = quote_count = reply_count = mention_count = 0
+
+    # Local aliases avoid repeated global and bound-method lookups per post
+    _normalize_user_id = normalize_user_id
+    _normalize_username = normalize_username
+    _extract_mentions = extract_mentions
 
     for user in interactions_data["users"]:
-        user_id = normalize_user_id(user.get("user_id", ""))
+        ug = user.get
+        user_id = _normalize_user_id(ug("user_id", ""))
         if not user_id:
             continue
 
         # Process posts
-        posts = user.get("posts", [])
+        posts = ug("posts", [])
         for post in posts:
-            post_id = post.get("post_id", "")
+            g = post.get
+            post_id = g("post_id", "")
 
             # Skip if we've already seen this post
             if post_id and post_id in seen_posts:
@@ -367,100 +483,89 @@ def process_seed_interactions(
             if post_id:
                 seen_posts.add(post_id)
 
-            post_text = post.get("text", "")
-            is_reply = post.get("is_reply", False)
-            is_retweet = post.get("is_retweet")
-            is_quote = post.get("is_quote")
-            reply_to_user_id = normalize_user_id(post.get("reply_to_user_id", ""))
-            # Fallback to username lookup if reply_to_user_id not available
-            if not reply_to_user_id:
-                reply_to_username = normalize_username(
-                    post.get("reply_to_username", "")
-                )
-                reply_to_user_id = username_to_id.get(reply_to_username, "")
+            post_text = g("text", "")
+            is_reply = g("is_reply", False)
+            is_retweet = g("is_retweet")
+            is_quote = g("is_quote")
 
             # Process retweets
             if is_retweet:
-                original_creator_id = normalize_user_id(
-                    post.get("original_post_creator_user_id", "")
+                original_creator_id = _normalize_user_id(
+                    g("original_post_creator_user_id", "")
                 )
                 # Fallback to username lookup
                 if not original_creator_id:
-                    original_creator_username = normalize_username(
-                        post.get("original_post_creator_username", "")
-                    )
-                    original_creator_id = username_to_id.get(
-                        original_creator_username, ""
+                    original_creator_id = resolve_username(
+                        _normalize_username(g("original_post_creator_username", "")),
+                        username_to_id,
+                        pending,
+                        "retweet",
+                        user_id,
+                        retweet_weight,
                     )
 
                 if original_creator_id and user_id != original_creator_id:
-                    interactions.append(
-                        {
-                            "type": "retweet",
-                            "source": user_id,
-                            "target": original_creator_id,
-                            "weight": retweet_weight,
-                        }
-                    )
-                    interaction_counts["retweet"] += 1
+                    yield ("retweet", user_id, original_creator_id, retweet_weight)
+                    retweet_count += 1
 
             # Process quotes (is_quote can be a dict or boolean)
             elif is_quote:
-                original_creator_id = normalize_user_id(
-                    post.get("original_post_creator_user_id", "")
+                original_creator_id = _normalize_user_id(
+                    g("original_post_creator_user_id", "")
                 )
                 # Fallback to username lookup
                 if not original_creator_id:
-                    original_creator_username = normalize_username(
-                        post.get("original_post_creator_username", "")
-                    )
-                    original_creator_id = username_to_id.get(
-                        original_creator_username, ""
+                    original_creator_id = resolve_username(
+                        _normalize_username(g("original_post_creator_username", "")),
+                        username_to_id,
+                        pending,
+                        "quote",
+                        user_id,
+                        quote_weight,
                     )
 
                 if original_creator_id and user_id != original_creator_id:
-                    interactions.append(
-                        {
-                            "type": "quote",
-                            "source": user_id,
-                            "target": original_creator_id,
-                            "weight": quote_weight,
-                        }
-                    )
-                    interaction_counts["quote"] += 1
+                    yield ("quote", user_id, original_creator_id, quote_weight)
+                    quote_count += 1
 
             # Process replies
-            elif is_reply and reply_to_user_id:
-                if user_id != reply_to_user_id:
-                    interactions.append(
-                        {
-                            "type": "reply",
-                            "source": user_id,
-                            "target": reply_to_user_id,
-                            "weight": reply_weight,
-                        }
+            elif is_reply:
+                reply_to_user_id = _normalize_user_id(g("reply_to_user_id", ""))
+                # Fallback to username lookup if reply_to_user_id not available
+                if not reply_to_user_id:
+                    reply_to_user_id = resolve_username(
+                        _normalize_username(g("reply_to_username", "")),
+                        username_to_id,
+                        pending,
+                        "reply",
+                        user_id,
+                        reply_weight,
                     )
-                    interaction_counts["reply"] += 1
+
+                if reply_to_user_id and user_id != reply_to_user_id:
+                    yield ("reply", user_id, reply_to_user_id, reply_weight)
+                    reply_count += 1
 
             # Process mentions in post text (lookup user_id from username)
-            mentions = extract_mentions(post_text)
+            mentions = _extract_mentions(post_text)
             for mentioned_username in mentions:
-                mentioned_user_id = username_to_id.get(mentioned_username, "")
+                mentioned_user_id = resolve_username(
+                    mentioned_username,
+                    username_to_id,
+                    pending,
+                    "mention",
+                    user_id,
+                    mention_weight,
+                )
                 if mentioned_user_id and user_id != mentioned_user_id:
-                    interactions.append(
-                        {
-                            "type": "mention",
-                            "source": user_id,
-                            "target": mentioned_user_id,
-                            "weight": mention_weight,
-                        }
-                    )
-                    interaction_counts["mention"] += 1
+                    yield ("mention", user_id, mentioned_user_id, mention_weight)
+                    mention_count += 1
 
         # Process replies (separate from posts in seed_interactions format)
-        replies = user.get("replies", [])
+        replies = ug("replies", [])
         for reply in replies:
-            reply_id = reply.get("post_id", "")
+            rg = reply.get
+            reply_id = rg("post_id", "")
 
             # Skip if we've already seen this reply
             if reply_id and reply_id in seen_posts:
@@ -468,70 +573,112 @@ def process_seed_interactions(
             if reply_id:
                 seen_posts.add(reply_id)
 
-            reply_text = reply.get("text", "")
-            reply_to_user_id = normalize_user_id(reply.get("reply_to_user_id", ""))
+            reply_text = rg("text", "")
+            reply_to_user_id = _normalize_user_id(rg("reply_to_user_id", ""))
             # Fallback to username lookup
             if not reply_to_user_id:
-                reply_to_username = normalize_username(
-                    reply.get("reply_to_username", "")
+                reply_to_user_id = resolve_username(
+                    _normalize_username(rg("reply_to_username", "")),
+                    username_to_id,
+                    pending,
+                    "reply",
+                    user_id,
+                    reply_weight,
                 )
-                reply_to_user_id = username_to_id.get(reply_to_username, "")
 
             if reply_to_user_id and user_id != reply_to_user_id:
-                interactions.append(
-                    {
-                        "type": "reply",
-                        "source": user_id,
-                        "target": reply_to_user_id,
-                        "weight": reply_weight,
-                    }
-                )
-                interaction_counts["reply"] += 1
+                yield ("reply", user_id, reply_to_user_id, reply_weight)
+                reply_count += 1
 
             # Process mentions in reply text (lookup user_id from username)
-            mentions = extract_mentions(reply_text)
+            mentions = _extract_mentions(reply_text)
             for mentioned_username in mentions:
-                mentioned_user_id = username_to_id.get(mentioned_username, "")
+                mentioned_user_id = resolve_username(
+                    mentioned_username,
+                    username_to_id,
+                    pending,
+                    "mention",
+                    user_id,
+                    mention_weight,
+                )
                 if mentioned_user_id and user_id != mentioned_user_id:
-                    interactions.append(
-                        {
-                            "type": "mention",
-                            "source": user_id,
-                            "target": mentioned_user_id,
-                            "weight": mention_weight,
-                        }
-                    )
-                    interaction_counts["mention"] += 1
-
+                    yield ("mention", user_id, mentioned_user_id, mention_weight)
+                    mention_count += 1
+
+    interaction_counts = {
+        "mention": mention_count,
+        "quote": quote_count,
+        "reply": reply_count,
+        "retweet": retweet_count,
+    }
     for interaction_type, count in sorted(interaction_counts.items()):
-        print(f"    Found {count} {interaction_type} interactions")
+        if count:
+            print(f"    Found {count} {interaction_type} interactions")
 
-    return interactions
 
+def resolve_pending_interactions(pending, username_to_id):
+    """Resolve deferred username-targeted interactions against the complete username map
 
-def aggregate_trust_scores(all_interactions):
-    """Aggregate trust scores for unique i,j pairs"""
-    trust_matrix = defaultdict(float)
-    interaction_stats = defaultdict(int)
+    Args:
+        pending: List of (type, source, username, weight) tuples
+        username_to_id: Mapping from username to user_id
 
-    print(f"  Aggregating {len(all_interactions)} total interactions")
+    Yields:
+        Resolved (type, source, target, weight) interaction tuples
+    """
+    interaction_counts = defaultdict(int)
 
-    for interaction in all_interactions:
-        source = interaction["source"]
-        target = interaction["target"]
-        weight = interaction["weight"]
-        interaction_type = interaction["type"]
+    print(f"  Resolving {len(pending)} username-targeted interactions")
 
+    for interaction_type, source, username, weight in pending:
+        target = username_to_id.get(username, "")
+        if target and source != target:
+            yield (interaction_type, source, target, weight)
+            interaction_counts[interaction_type] += 1
+
+    for interaction_type, count in sorted(interaction_counts.items()):
+        print(f"    Resolved {count} {interaction_type} interactions")
+
+
+def accumulate_interactions(interactions, trust_matrix, interaction_stats):
+    """Add interactions into a running trust matrix and per-type counts
+
+    Args:
+        interactions: Iterable of (type, source, target, weight) tuples
+        trust_matrix: defaultdict(float) keyed by (source, target)
+        interaction_stats: defaultdict(int) keyed by interaction type
+
+    Returns:
+        Number of interactions consumed
+    """
+    interaction_count = 0
+    for interaction_type, source, target, weight in interactions:
+        interaction_count += 1
         if source and target and source != target:
-            pair = (source, target)
-            trust_matrix[pair] += weight
+            trust_matrix[(source, target)] += weight
             interaction_stats[interaction_type] += 1
+    return interaction_count
+
 
+def print_trust_summary(trust_matrix, interaction_stats):
+    """Print the interaction type breakdown and trust relationship count"""
     print(f"  Interaction type breakdown:")
     for interaction_type, count in sorted(interaction_stats.items()):
         print(f"    {interaction_type}: {count}")
 
     print(f"  Unique trust relationships: {len(trust_matrix)}")
+
+
+def aggregate_trust_scores(all_interactions):
+    """Aggregate trust scores for unique i,j pairs"""
+    trust_matrix = defaultdict(float)
+    interaction_stats = defaultdict(int)
+
+    print(f"  Aggregating {len(all_interactions)} total interactions")
+
+    accumulate_interactions(all_interactions, trust_matrix, interaction_stats)
+
+    print_trust_summary(trust_matrix, interaction_stats)
     return trust_matrix
 
 
@@ -540,8 +687,9 @@ def save_trust_matrix(trust_matrix, output_name, trust_dir):
     os.makedirs(trust_dir, exist_ok=True)
     filename = os.path.join(trust_dir, f"{output_name}.csv")
 
-    # Sort pairs for consistent output
-    sorted_pairs = sorted(trust_matrix.items(), key=lambda x: (x[0][0], x[0][1]))
+    # Sort pairs for consistent output (keys are (i, j) tuples, which already
+    # sort lexicographically without a key function)
+    sorted_pairs = sorted(trust_matrix.items())
 
     with open(filename, "w", newline="", encoding="utf-8") as csvfile:
         writer = csv.writer(csvfile)
@@ -550,19 +698,18 @@ def save_trust_matrix(trust_matrix, output_name, trust_dir):
         writer.writerow(["i", "j", "v"])
 
         # Write data
-        for (i, j), v in sorted_pairs:
-            writer.writerow([i, j, v])
+        writer.writerows((i, j, v) for (i, j), v in sorted_pairs)
 
     print(f"✅ Trust matrix saved to: {filename}")
     print(f"📊 Total pairs: {len(sorted_pairs)}")
 
-    # Show statistics
+    # Show statistics (computed over the dict's values view, no extra list)
     if sorted_pairs:
-        values = [v for (_, _), v in sorted_pairs]
+        values = trust_matrix.values()
         min_weight = min(values)
         max_weight = max(values)
-        avg_weight = sum(values) / len(values)
         total_weight = sum(values)
+        avg_weight = total_weight / len(values)
 
         print(f"📈 Trust score statistics:")
         print(f"  - Min: {min_weight}")
@@ -573,6 +720,14 @@ def save_trust_matrix(trust_matrix, output_name, trust_dir):
     return filename
 
 
+def count_lines(filename, chunk_size=1 << 16):
+    """Count newline-terminated lines by scanning the file in binary chunks"""
+    with open(filename, "rb") as f:
+        return sum(
+            chunk.count(b"\n") for chunk in iter(lambda: f.read(chunk_size), b"")
+        )
+
+
 def process_raw_data(raw_data_dir, trust_dir, trust_weights):
     """Process raw data files in the format {seed_graph}_{range}.json and {seed_graph}_followings.json
 
@@ -608,7 +763,11 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
     generated_files = []
 
     for seed_graph_name in seed_graph_names:
-        all_interactions = []
+        # Interactions are folded into the trust matrix as each source is
+        # processed, so the full interaction list is never held in memory
+        trust_matrix = defaultdict(float)
+        interaction_stats = defaultdict(int)
+        total_interactions = 0
         seen_follows = set()
         seen_posts = set()
         total_files_processed = 0
@@ -624,7 +783,7 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
         extended_followings_file = os.path.join(
             raw_data_dir, f"{seed_graph_name}_extended_followings.json"
         )
-        extended_followings_data = load_json_file(extended_followings_file)
+        has_extended_followings = os.path.exists(extended_followings_file)
 
         # Look for interaction files matching pattern {seed_graph_name}_{id1}_{id2}.json
         pattern = os.path.join(raw_data_dir, f"{seed_graph_name}_*_*.json")
@@ -637,7 +796,7 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
 
         if (
             not followings_data
-            and not extended_followings_data
+            and not has_extended_followings
             and not interaction_files
         ):
             print(f"  ⚠️ No data files found for {seed_graph_name}")
@@ -659,64 +818,92 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
                     username_to_id[username] = user_id
             total_files_processed += 1
 
-        # Add from extended followings
-        if extended_followings_data:
-            for user in extended_followings_data.get("users", []):
-                username = normalize_username(user.get("username", ""))
-                user_id = normalize_user_id(user.get("user_id", ""))
-                if username and user_id:
-                    username_to_id[username] = user_id
-
-        # Build username map from interaction files (process one at a time to save memory)
-        print(
-            f"  📁 Building username map from {len(interaction_files)} interaction files..."
-        )
-        for interaction_file in sorted(interaction_files):
-            data = load_json_file(interaction_file)
-            if data:
-                for user in data.get("users", []):
-                    username = normalize_username(user.get("username", ""))
-                    user_id = normalize_user_id(user.get("user_id", ""))
-                    if username and user_id:
-                        username_to_id[username] = user_id
-            del data  # Free memory
-
-        print(f"  📝 Built username->user_id map with {len(username_to_id)} entries")
-
         # Free followings_data - no longer needed
         del followings_data
 
-        # Process extended followings (with deduplication)
-        if extended_followings_data:
-            extended_following_interactions = process_seed_extended_followings(
-                extended_followings_data, trust_weights, seen_follows
+        # Stream extended followings (with deduplication). Its usernames,
+        # follow pairs and interactions are staged and only merged once the
+        # whole file has parsed, so a truncated file contributes nothing.
+        if has_extended_followings:
+            file_usernames = {}
+            file_follows = StagedSet(seen_follows)
+            extended_users = register_usernames(
+                iter_json_items(extended_followings_file, "users.item"),
+                file_usernames,
             )
-            all_interactions.extend(extended_following_interactions)
-            total_files_processed += 1
-            print(
-                f"  📥 Added {len(extended_following_interactions)} follow interactions from extended_followings"
+            extended_following_interactions = read_file_interactions(
+                process_seed_extended_followings(
+                    {"users": extended_users}, trust_weights, file_follows
+                )
             )
+            if extended_following_interactions is None:
+                print(f"  ⚠️ Skipped {os.path.basename(extended_followings_file)}")
+            else:
+                username_to_id.update(file_usernames)
+                seen_follows.update(file_follows)
+                extended_following_count = accumulate_interactions(
+                    extended_following_interactions, trust_matrix, interaction_stats
+                )
+                total_interactions += extended_following_count
+                total_files_processed += 1
+                print(
+                    f"  📥 Added {extended_following_count} follow interactions from extended_followings"
+                )
             del extended_following_interactions  # Free memory
 
-        # Free extended_followings_data - no longer needed
-        del extended_followings_data
-
-        # Process each interaction data file one at a time
+        # Stream each interaction data file one user at a time. Each file is
+        # read only once: its users extend the username map in the same pass.
+        # Username targets already in the map (including this file's earlier
+        # users) resolve in place; only still-unknown names wait in pending
+        # until all files have been read.
+        # A file's usernames, post IDs, pending lookups and interactions are
+        # staged and merged only after it has parsed completely.
+        pending = []
         print(f"  📁 Processing {len(interaction_files)} interaction files...")
         for idx, interaction_file in enumerate(sorted(interaction_files)):
-            interactions_data = load_json_file(interaction_file)
-            if interactions_data:
-                seed_interactions = process_seed_interactions(
-                    interactions_data, trust_weights, seen_posts, username_to_id
+            file_usernames = {}
+            file_posts = StagedSet(seen_posts)
+            file_pending = []
+            users = register_usernames(
+                iter_json_items(interaction_file, "users.item"), file_usernames
+            )
+            seed_interactions = read_file_interactions(
+                process_seed_interactions(
+                    {"users": users},
+                    trust_weights,
+                    file_posts,
+                    ChainMap(file_usernames, username_to_id),
+                    file_pending,
+                )
+            )
+            if seed_interactions is None:
+                print(f"  ⚠️ Skipped {os.path.basename(interaction_file)}")
+            else:
+                username_to_id.update(file_usernames)
+                seen_posts.update(file_posts)
+                pending.extend(file_pending)
+                total_interactions += accumulate_interactions(
+                    seed_interactions, trust_matrix, interaction_stats
                 )
-                all_interactions.extend(seed_interactions)
                 total_files_processed += 1
-                del seed_interactions  # Free memory
-            del interactions_data  # Free memory
+            del seed_interactions, file_posts, file_pending  # Free memory
 
             if (idx + 1) % 10 == 0:
                 print(f"    Processed {idx + 1}/{len(interaction_files)} files...")
 
+        print(f"  📝 Built username->user_id map with {len(username_to_id)} entries")
+
+        # Targets whose username was only registered later in the run are
+        # folded in here, after all files, instead of in file order. With
+        # non-integer weights a pair's total can therefore differ in the last
+        # ulp from a strictly file-ordered sum; integer weights are exact.
+        total_interactions += accumulate_interactions(
+            resolve_pending_interactions(pending, username_to_id),
+            trust_matrix,
+            interaction_stats,
+        )
+        del pending  # Free memory
+
         # Save username_to_id map to CSV
         usernames_file = os.path.join(raw_data_dir, f"{seed_graph_name}_usernames.csv")
         with open(usernames_file, "w", encoding="utf-8") as f:
@@ -730,7 +917,7 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
 
         print(f"\n📊 Summary for {seed_graph_name}:")
         print(f"  Total files processed: {total_files_processed}")
-        print(f"  Total interactions collected: {len(all_interactions)}")
+        print(f"  Total interactions collected: {total_interactions}")
         print(f"  Unique follow relationships: {len(seen_follows)}")
         print(f"  Unique posts/replies processed: {len(seen_posts)}")
 
@@ -738,15 +925,12 @@ def process_raw_data(raw_data_dir, trust_dir, trust_weights):
         del seen_follows
         del seen_posts
 
-        if not all_interactions:
+        if not total_interactions:
             print(f"⚠️ No interactions found for {seed_graph_name}")
             continue
 
-        # Aggregate trust scores
-        trust_matrix = aggregate_trust_scores(all_interactions)
-
-        # Free all_interactions - no longer needed
-        del all_interactions
+        print_trust_summary(trust_matrix, interaction_stats)
+        del interaction_stats
 
         if not trust_matrix:
             print(f"⚠️ No trust relationships calculated for {seed_graph_name}")
@@ -875,16 +1059,20 @@ def process_seed_graph(raw_data_dir, trust_dir, trust_weights):
 
         # Process followings (with deduplication)
         if followings_data:
-            following_interactions = process_seed_followings(
-                followings_data, trust_weights, seen_follows, username_to_id
+            following_interactions = list(
+                process_seed_followings(
+                    followings_data, trust_weights, seen_follows, username_to_id
+                )
             )
             all_interactions.extend(following_interactions)
             print(f"    Added {len(following_interactions)} unique follow interactions")
 
         # Process extended followings (with deduplication)
         if extended_followings_data:
-            extended_following_interactions = process_seed_extended_followings(
-                extended_followings_data, trust_weights, seen_follows
+            extended_following_interactions = list(
+                process_seed_extended_followings(
+                    extended_followings_data, trust_weights, seen_follows
+                )
             )
             all_interactions.extend(extended_following_interactions)
             print(
@@ -893,8 +1081,10 @@ def process_seed_graph(raw_data_dir, trust_dir, trust_weights):
 
         # Process interactions (with deduplication)
         if interactions_data:
-            seed_interactions = process_seed_interactions(
-                interactions_data, trust_weights, seen_posts, username_to_id
+            seed_interactions = list(
+                process_seed_interactions(
+                    interactions_data, trust_weights, seen_posts, username_to_id
+                )
             )
             all_interactions.extend(seed_interactions)
             print(f"    Added {len(seed_interactions)} unique interaction records")
@@ -960,8 +1150,7 @@ def main():
         # Show generated file info
         for filename in generated_files:
             if os.path.exists(filename):
-                with open(filename, "r") as f:
-                    line_count = sum(1 for _ in f) - 1  # Subtract header
+                line_count = count_lines(filename) - 1  # Subtract header
                 filename_base = os.path.basename(filename)
                 print(
                     f"📄 Generated file: {filename_base} ({line_count} trust relationships)"
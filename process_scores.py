@@ -11,12 +11,16 @@ This script processes EigenTrust scores:
 """
 
 import argparse
-import csv
 import math
 import os
 
+import numpy as np
+import pandas as pd
 import toml
 
+# Output rows formatted and written per f.write call in save_output
+WRITE_CHUNK_ROWS = 10000
+
 
 def load_config():
     """Load configuration from config.toml"""
@@ -33,6 +37,14 @@ def load_config():
         return None
 
 
+def parse_score(value):
+    """Parse a score string as float() does, returning NaN if it is not a number"""
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
 def load_scores(scores_dir, seed_graph_name):
     """Load scores from CSV file
 
@@ -41,7 +53,7 @@ def load_scores(scores_dir, seed_graph_name):
         seed_graph_name: Name of the seed graph
 
     Returns:
-        List of (user_id, score) tuples
+        Tuple of (user_ids, scores) NumPy arrays
     """
     filename = os.path.join(scores_dir, f"{seed_graph_name}.csv")
 
@@ -51,21 +63,31 @@ def load_scores(scores_dir, seed_graph_name):
 
     print(f"Loading {filename}...")
 
-    scores = []
-    with open(filename, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            user_id = row.get("i", "").strip()
-            score_str = row.get("v", "").strip()
-            if user_id and score_str:
-                try:
-                    score = float(score_str)
-                    scores.append((user_id, score))
-                except ValueError:
-                    continue
+    # Parse with pandas' C reader; round_trip precision reads the same floats
+    # as float() would, and IDs stay strings (no float/NaN coercion)
+    try:
+        df = pd.read_csv(
+            filename,
+            usecols=["i", "v"],
+            dtype={"i": str},
+            keep_default_na=False,
+            float_precision="round_trip",
+        )
+    except ValueError as e:
+        print(f"Error reading {filename}: {e}")
+        return None
+
+    if not pd.api.types.is_numeric_dtype(df["v"]):
+        # Blank or malformed scores leave the column as text; those rows are skipped
+        df["v"] = df["v"].map(parse_score)
+
+    df["i"] = df["i"].str.strip()
+    df = df[(df["i"] != "") & df["v"].notna()]
+    user_ids = df["i"].to_numpy(dtype=object)
+    scores = df["v"].to_numpy(dtype=np.float64)
 
     print(f"  Loaded {len(scores)} scores")
-    return scores
+    return user_ids, scores
 
 
 def load_usernames(raw_data_dir, seed_graph_name):
@@ -86,67 +108,72 @@ def load_usernames(raw_data_dir, seed_graph_name):
 
     print(f"Loading {filename}...")
 
-    username_map = {}
-    with open(filename, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            username = row.get("username", "").strip()
-            user_id = row.get("user_id", "").strip()
-            if user_id and username:
-                username_map[user_id] = username
+    try:
+        df = pd.read_csv(
+            filename, usecols=["user_id", "username"], dtype=str, keep_default_na=False
+        )
+    except ValueError as e:
+        print(f"Error reading {filename}: {e}")
+        return {}
+
+    user_ids = df["user_id"].str.strip()
+    usernames = df["username"].str.strip()
+    valid = (user_ids != "") & (usernames != "")
+    username_map = dict(zip(user_ids[valid].tolist(), usernames[valid].tolist()))
 
     print(f"  Loaded {len(username_map)} usernames")
     return username_map
 
 
-def process_scores(scores):
+def process_scores(user_ids, scores):
     """Process scores through log2 and normalize to 0.0-1.0 range
 
     Args:
-        scores: List of (user_id, score) tuples
+        user_ids: Array of user IDs
+        scores: Array of raw scores, parallel to user_ids
 
     Returns:
-        List of (user_id, normalized_score) tuples
+        Tuple of (user_ids, normalized_scores) NumPy arrays, or None if no
+        score is positive
     """
     print("Processing scores...")
 
     # Apply log2 to all scores (filter out zero/negative scores)
-    log_scores = []
-    for user_id, score in scores:
-        if score > 0:
-            log_score = math.log2(score)
-            log_scores.append((user_id, log_score))
+    positive = scores > 0
+    user_ids = user_ids[positive]
+    log_scores = np.log2(scores[positive])
 
-    if not log_scores:
+    if not len(log_scores):
         print("  No valid scores after log2 transformation")
-        return []
+        return None
 
     # Find min and max for normalization
-    min_score = min(s for _, s in log_scores)
-    max_score = max(s for _, s in log_scores)
+    min_score = log_scores.min()
+    max_score = log_scores.max()
 
     print(f"  Log2 score range: {min_score:.4f} to {max_score:.4f}")
 
-    # Normalize to 0.0-1.0 range
+    # Normalize to 0.0-1.0 range, in place on the log2 array
     score_range = max_score - min_score
     if score_range == 0:
         # All scores are the same
-        normalized_scores = [(user_id, 0.5) for user_id, _ in log_scores]
+        log_scores.fill(0.5)
     else:
-        normalized_scores = [
-            (user_id, (log_score - min_score) / score_range)
-            for user_id, log_score in log_scores
-        ]
+        np.subtract(log_scores, min_score, out=log_scores)
+        np.divide(log_scores, score_range, out=log_scores)
 
-    print(f"  Processed {len(normalized_scores)} scores")
-    return normalized_scores
+    print(f"  Processed {len(log_scores)} scores")
+    return user_ids, log_scores
 
 
-def save_output(scores, username_map, output_dir, seed_graph_name, use_user_ids=False):
+def save_output(
+    user_ids, scores, username_map, output_dir, seed_graph_name, use_user_ids=False
+):
     """Save processed scores to output CSV
 
     Args:
-        scores: List of (user_id, score) tuples
+        user_ids: Array of user IDs
+        scores: Array of scores, parallel to user_ids
         username_map: Dict mapping user_id -> username
         output_dir: Directory to save output
         seed_graph_name: Name of the seed graph
@@ -155,19 +182,27 @@ def save_output(scores, username_map, output_dir, seed_graph_name, use_user_ids=
     os.makedirs(output_dir, exist_ok=True)
     filename = os.path.join(output_dir, f"{seed_graph_name}.csv")
 
-    # Sort by score descending
-    sorted_scores = sorted(scores, key=lambda x: x[1], reverse=True)
+    # Sort by score descending; a stable argsort on the negated scores keeps
+    # tied users in input order, as sorted(..., reverse=True) did
+    order = np.argsort(-scores, kind="stable")
+    names = user_ids[order].tolist()
+    if use_user_ids:
+        header = "user_id,score\n"
+    else:
+        header = "username,score\n"
+        get_username = username_map.get
+        names = [get_username(user_id, user_id) for user_id in names]
+
+    sorted_scores = scores[order].tolist()
 
-    with open(filename, "w", encoding="utf-8") as f:
-        if use_user_ids:
-            f.write("user_id,score\n")
-            for user_id, score in sorted_scores:
-                f.write(f"{user_id},{score}\n")
-        else:
-            f.write("username,score\n")
-            for user_id, score in sorted_scores:
-                username = username_map.get(user_id, user_id)
-                f.write(f"{username},{score}\n")
+    # A 1 MiB buffer turns the writes into a few large syscalls, and rows are
+    # joined in chunks so each chunk costs one write call instead of one per row
+    with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(header)
+        for start in range(0, len(names), WRITE_CHUNK_ROWS):
+            end = start + WRITE_CHUNK_ROWS
+            chunk = zip(names[start:end], sorted_scores[start:end])
+            f.write("".join([f"{name},{score}\n" for name, score in chunk]))
 
     print(f"✓ Saved {len(scores)} scores to: {filename}")
 
@@ -210,32 +245,39 @@ def main():
     output_dir = os.path.join(script_dir, "output")
 
     # Load scores
-    scores = load_scores(scores_dir, seed_graph_name)
-    if not scores:
+    loaded_scores = load_scores(scores_dir, seed_graph_name)
+    if loaded_scores is None:
+        return
+    user_ids, scores = loaded_scores
+    if not len(scores):
         return
 
     # Load usernames
     username_map = load_usernames(raw_data_dir, seed_graph_name)
 
     # Process scores
-    processed_scores = process_scores(scores)
-    if not processed_scores:
+    processed_scores = process_scores(user_ids, scores)
+    if processed_scores is None:
         return
+    user_ids, normalized_scores = processed_scores
 
     # Save output
     save_output(
-        processed_scores, username_map, output_dir, seed_graph_name, args.user_ids
+        user_ids,
+        normalized_scores,
+        username_map,
+        output_dir,
+        seed_graph_name,
+        args.user_ids,
     )
 
     # Summary
     print(f"\nSummary:")
-    print(f"  Total scores: {len(processed_scores)}")
+    print(f"  Total scores: {len(user_ids)}")
     if not args.user_ids:
-        mapped_count = sum(
-            1 for user_id, _ in processed_scores if user_id in username_map
-        )
+        mapped_count = sum(1 for user_id in user_ids if user_id in username_map)
         print(f"  Mapped to usernames: {mapped_count}")
-        print(f"  Using user IDs: {len(processed_scores) - mapped_count}")
+        print(f"  Using user IDs: {len(user_ids) - mapped_count}")
 
 
 if __name__ == "__main__":